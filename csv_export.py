@@ -0,0 +1,119 @@
+from pandas import DataFrame
+
+
+class CsvPartWriter:
+    """
+        Writes DataFrame chunks to a CSV file, starting a new part file whenever a size or row limit is reached.
+
+        The first part is written to the given file path, further parts to "<name>_part<N>.csv". Every part starts
+        with the header line.
+
+        Attributes:
+            __file: The currently open part file.
+            __part_size: Bytes written to the current part.
+            __part_rows: Data rows written to the current part.
+    """
+
+    def __init__(self, file_path: str, max_file_size: float = None, max_file_rows: int = None):
+        """
+                Initializes the writer; no file is created until the first chunk arrives.
+
+                Args:
+                    file_path (str): The path of the first part file.
+                    max_file_size (float, optional): The maximum part size in megabytes (None or 0 for unlimited).
+                    max_file_rows (int, optional): The maximum number of data rows per part (None or 0 for unlimited).
+        """
+        self.__file_path = file_path
+        self.__max_size_bytes = max_file_size * 1024 * 1024 if max_file_size else 0
+        self.__max_file_rows = max_file_rows or 0
+        self.__header = None
+        self.__file = None
+        self.__part_size = 0
+        self.__part_rows = 0
+        self.part_count = 0
+        self.rows_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __part_path(self, part_number: int) -> str:
+        return self.__file_path if part_number == 1 else f"{self.__file_path.rsplit('.', 1)[0]}_part{part_number}.csv"
+
+    def __start_part(self):
+        """
+                Closes the current part file and opens the next one with the header line.
+        """
+        self.close()
+        self.part_count += 1
+        self.__file = open(self.__part_path(self.part_count), 'w', encoding='utf-8', newline='')
+        self.__file.write(self.__header)
+        self.__part_size = len(self.__header.encode('utf-8'))
+        self.__part_rows = 0
+
+    def __is_part_full(self, record_size: int) -> bool:
+        if self.__part_rows == 0:
+            return False
+        if self.__max_file_rows and self.__part_rows >= self.__max_file_rows:
+            return True
+        return bool(self.__max_size_bytes) and self.__part_size + record_size > self.__max_size_bytes
+
+    @staticmethod
+    def __split_records(text: str):
+        """
+                Splits CSV text into records, keeping line breaks inside quoted fields within their record.
+
+                Args:
+                    text (str): CSV text with "\\n" line terminators.
+        """
+        record = ""
+        for line in text.split("\n")[:-1]:
+            record += line + "\n"
+            if record.count('"') % 2 == 0:
+                yield record
+                record = ""
+
+    def write(self, chunk: DataFrame):
+        """
+                Appends a chunk of rows, splitting it across part files as the limits require.
+
+                Args:
+                    chunk (DataFrame): The rows to write. All chunks must have the same columns.
+        """
+        if chunk.empty:
+            return
+
+        if self.__header is None:
+            self.__header = chunk.iloc[:0].to_csv(index=False, lineterminator="\n")
+            self.__start_part()
+
+        if not self.__max_size_bytes:
+            start = 0
+            while start < len(chunk):
+                if self.__is_part_full(0):
+                    self.__start_part()
+                free_rows = self.__max_file_rows - self.__part_rows if self.__max_file_rows else len(chunk)
+                part_df = chunk.iloc[start:start + free_rows]
+                part_df.to_csv(self.__file, header=False, index=False, lineterminator="\n")
+                self.__part_rows += len(part_df)
+                start += len(part_df)
+        else:
+            for record in self.__split_records(chunk.to_csv(header=False, index=False, lineterminator="\n")):
+                record_size = len(record.encode('utf-8'))
+                if self.__is_part_full(record_size):
+                    self.__start_part()
+                self.__file.write(record)
+                self.__part_size += record_size
+                self.__part_rows += 1
+
+        self.rows_written += len(chunk)
+
+    def close(self):
+        """
+                Closes the current part file.
+        """
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
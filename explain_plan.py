@@ -0,0 +1,199 @@
+import json
+from datetime import datetime
+
+
+class PlanNode:
+    """
+        A single node of an EXPLAIN (ANALYZE, BUFFERS) plan tree with its derived timing and estimate metrics.
+
+        Attributes:
+            description: A short human-readable description of the node, e.g. "Index Scan using idx on orders".
+            loops: How many times the node was executed, summed over all parallel processes. 0 if it never ran.
+            total_time: Inclusive wall-clock time in milliseconds spent in the node and its children.
+            self_time: Wall-clock time in milliseconds spent in the node itself. It is reported as computed, so
+                timing noise can make it slightly negative.
+            actual_rows: Rows produced over all loops.
+            plan_rows: Rows the planner estimated over all loops.
+            total_shared_hit_blocks: Shared buffer hits of the node and its children.
+            total_shared_read_blocks: Shared buffer reads of the node and its children.
+            shared_hit_blocks: Shared buffer hits of the node itself.
+            shared_read_blocks: Shared buffer reads of the node itself.
+            children: The child nodes.
+    """
+
+    __GATHER_NODE_TYPES = ('Gather', 'Gather Merge')
+
+    def __init__(self, plan: dict, parallel_processes: int = 1):
+        """
+                Builds the node and its subtree from the JSON plan of a node.
+
+                Below a Gather node, "Actual Loops" counts the loops of the leader and all workers, which run at the
+                same time, while the times are per-loop averages. The time over all loops is therefore divided by
+                the number of processes the loops ran in, so that it stays comparable with the Gather's own time.
+
+                Args:
+                    plan (dict): A "Plan" object from EXPLAIN (FORMAT JSON) output.
+                    parallel_processes (int): The number of processes the node ran in (leader plus launched workers).
+        """
+        self.description = self.__describe(plan)
+        self.loops = plan.get('Actual Loops', 1)
+        self.total_time = plan.get('Actual Total Time', 0.0) * self.loops / max(min(self.loops, parallel_processes), 1)
+        self.actual_rows = plan.get('Actual Rows', 0) * self.loops
+        self.plan_rows = plan.get('Plan Rows', 0) * self.loops
+        self.total_shared_hit_blocks = plan.get('Shared Hit Blocks', 0)
+        self.total_shared_read_blocks = plan.get('Shared Read Blocks', 0)
+
+        if plan.get('Node Type') in self.__GATHER_NODE_TYPES:
+            parallel_processes = plan.get('Workers Launched', plan.get('Workers Planned', 0)) + 1
+
+        self.children = [PlanNode(child, parallel_processes) for child in plan.get('Plans', [])]
+        self.self_time = self.total_time - sum(child.total_time for child in self.children)
+        self.shared_hit_blocks = self.total_shared_hit_blocks - sum(
+            child.total_shared_hit_blocks for child in self.children)
+        self.shared_read_blocks = self.total_shared_read_blocks - sum(
+            child.total_shared_read_blocks for child in self.children)
+
+    @property
+    def was_executed(self) -> bool:
+        """
+                Whether the node ran at all; nodes pruned at run time or never reached report zero loops.
+        """
+        return self.loops > 0
+
+    @staticmethod
+    def __describe(plan: dict) -> str:
+        node_type = plan.get('Node Type', '?')
+        join_type = plan.get('Join Type')
+        if join_type and join_type != 'Inner':
+            node_type = f"{node_type} ({join_type})"
+
+        if 'Index Name' in plan:
+            node_type += f" using {plan['Index Name']}"
+        if 'Relation Name' in plan:
+            alias = plan.get('Alias')
+            relation = plan['Relation Name']
+            node_type += f" on {relation}" + (f" {alias}" if alias and alias != relation else "")
+        elif 'CTE Name' in plan:
+            node_type += f" on {plan['CTE Name']}"
+        elif 'Function Name' in plan:
+            node_type += f" on {plan['Function Name']}"
+
+        return node_type
+
+    @property
+    def misestimate(self) -> float:
+        """
+                The factor by which the planner's row estimate was off, in either direction (1.0 means exact).
+        """
+        actual_rows = max(self.actual_rows, 1)
+        plan_rows = max(self.plan_rows, 1)
+        return max(actual_rows, plan_rows) / min(actual_rows, plan_rows)
+
+    def walk(self):
+        """
+                Iterates over the node and all its descendants in pre-order.
+        """
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+class ExplainPlan:
+    """
+        A parsed EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) result of one profiling run.
+
+        Attributes:
+            root: The root PlanNode.
+            planning_time: Planning time in milliseconds.
+            execution_time: Execution time in milliseconds.
+            captured_at: When the plan was captured.
+    """
+
+    HOT_SPOT_SHARE = 0.1
+
+    def __init__(self, explain_output):
+        """
+                Parses the output of EXPLAIN (FORMAT JSON).
+
+                Args:
+                    explain_output (list | str): The "QUERY PLAN" value, either already decoded or as JSON text.
+        """
+        if isinstance(explain_output, str):
+            explain_output = json.loads(explain_output)
+
+        result = explain_output[0]
+        self.root = PlanNode(result['Plan'])
+        self.planning_time = result.get('Planning Time', 0.0)
+        self.execution_time = result.get('Execution Time', 0.0)
+        self.captured_at = datetime.now()
+        self.__total_self_time = sum(node.self_time for node in self.root.walk())
+
+    def self_time_share(self, node: PlanNode) -> float:
+        """
+                Returns the share of the node's self time in the self time of the whole plan.
+
+                Args:
+                    node (PlanNode): A node of this plan.
+
+                Returns:
+                    float: A value between 0 and 1.
+        """
+        return node.self_time / self.__total_self_time if self.__total_self_time else 0.0
+
+    def hot_spots(self) -> list:
+        """
+                Returns the nodes that account for at least HOT_SPOT_SHARE of the plan's self time.
+
+                Returns:
+                    list: The hot nodes, most expensive first.
+        """
+        nodes = [node for node in self.root.walk() if self.self_time_share(node) >= self.HOT_SPOT_SHARE]
+        return sorted(nodes, key=lambda node: node.self_time, reverse=True)
+
+
+class PlanHistory:
+    """
+        Keeps the profiled plans of each query so that runs of the same query can be compared.
+
+        Attributes:
+            __runs: Plans per normalized query text, oldest first.
+            __max_runs: How many plans are kept per query.
+    """
+
+    def __init__(self, max_runs: int = 10):
+        """
+                Initializes an empty history.
+
+                Args:
+                    max_runs (int): How many plans are kept per query; older plans are dropped.
+        """
+        self.__runs = {}
+        self.__max_runs = max_runs
+
+    @staticmethod
+    def __normalize(query: str) -> str:
+        return " ".join(query.split())
+
+    def add(self, query: str, plan: ExplainPlan):
+        """
+                Records a plan for a query.
+
+                Args:
+                    query (str): The profiled query.
+                    plan (ExplainPlan): Its plan.
+        """
+        runs = self.__runs.setdefault(self.__normalize(query), [])
+        runs.append(plan)
+        del runs[:-self.__max_runs]
+
+    def runs(self, query: str) -> list:
+        """
+                Returns the recorded plans of a query.
+
+                Args:
+                    query (str): The profiled query.
+
+                Returns:
+                    list: The plans, oldest first.
+        """
+        return list(self.__runs.get(self.__normalize(query), []))
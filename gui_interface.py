@@ -1,46 +1,174 @@
-import io
+import logging
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
 import pandas as pd
-from pandas import DataFrame
+from psycopg2.pool import PoolError
+
+from csv_export import CsvPartWriter
+from explain_plan import ExplainPlan, PlanHistory
+from result_memory_budget import ResultMemoryBudget
 
 
 class PsqlGuiApp:
     """
         A GUI application for executing SQL queries against a PostgreSQL database and managing the results.
+
+        Every query tab has its own query editor, result table and connection checked out from a shared pool,
+        so queries in different tabs run concurrently in the background.
     """
 
-    def __init__(self, root, psql_connection):
+    def __init__(self, root, connection_pool, memory_budget):
         """
-                Initializes the application's GUI components and sets up the database connection.
+                Initializes the application's GUI components and opens the first query tab.
 
                 Args:
                     root: The root Tkinter widget.
-                    psql_connection (PsqlConnection): An instance of PsqlConnection to interact with the database.
+                    connection_pool (PsqlConnectionPool): The pool the tabs check their connections out from.
+                    memory_budget (ResultMemoryBudget): The memory budget shared by the results of all tabs.
+        """
+        self.__root = root
+        self.__connection_pool = connection_pool
+        self.__memory_budget = memory_budget
+        self.__plan_history = PlanHistory()
+        self.__tabs = {}
+        self.__tab_counter = 0
+
+        self.__root.title("PSQLVue UI Executor")
+        self.__toolbar = tk.Frame(self.__root)
+        self.__new_tab_button = tk.Button(self.__toolbar, text="New Tab", command=self.__open_tab)
+        self.__close_tab_button = tk.Button(self.__toolbar, text="Close Tab", command=self.__close_current_tab)
+        self.__notebook = ttk.Notebook(self.__root)
+
+        self.__setup_ui()
+        self.__open_tab()
+
+    def __setup_ui(self):
+        """
+            Sets up the tab toolbar, the tab container and the application-wide key bindings.
+        """
+        self.__toolbar.pack(fill=tk.X, padx=5, pady=5)
+        self.__new_tab_button.pack(side=tk.LEFT)
+        self.__close_tab_button.pack(side=tk.LEFT, padx=5)
+        self.__notebook.pack(fill=tk.BOTH, expand=True)
+
+        self.__root.bind_all("<Control-z>", lambda event: self.__dispatch_to_current_tab(
+            lambda tab: tab.query_input.edit_undo()))
+        self.__root.bind_all("<Control-y>", lambda event: self.__dispatch_to_current_tab(
+            lambda tab: tab.query_input.edit_redo()))
+        self.__root.bind_all("<Control-c>", lambda event: self.__dispatch_to_current_tab(
+            lambda tab: tab.query_input.event_generate('<<Copy>>')))
+        self.__root.bind_all("<Control-x>", lambda event: self.__dispatch_to_current_tab(
+            lambda tab: tab.query_input.event_generate('<<Cut>>')))
+
+        self.__root.protocol("WM_DELETE_WINDOW", self.__on_close)
+
+    def __dispatch_to_current_tab(self, action):
+        """
+            Applies an action to the currently selected query tab, if any.
+
+            Args:
+                action: A callable receiving the selected _QueryTab.
+        """
+        tab = self.__tabs.get(self.__notebook.select())
+        if tab is not None:
+            action(tab)
+
+    def __open_tab(self):
+        """
+            Opens a new query tab with a connection checked out from the pool.
+        """
+        try:
+            psql_connection = self.__connection_pool.acquire()
+        except PoolError:
+            messagebox.showerror("Error", "All database connections are in use. Close a tab to open a new one.")
+            return
+
+        self.__tab_counter += 1
+        tab = _QueryTab(self.__root, self.__notebook, f"Query {self.__tab_counter}", psql_connection,
+                        self.__memory_budget, self.__plan_history)
+        self.__tabs[str(tab.frame)] = tab
+        self.__notebook.select(tab.frame)
+
+    def __close_current_tab(self):
+        """
+            Closes the selected query tab and gives its connection and result memory back.
+        """
+        tab_id = self.__notebook.select()
+        tab = self.__tabs.pop(tab_id, None)
+        if tab is None:
+            return
+
+        tab.close()
+        self.__notebook.forget(tab_id)
+        tab.frame.destroy()
+
+    def __on_close(self):
+        """
+            Closes all query tabs, cancelling their running statements, and the main window.
+        """
+        for tab in self.__tabs.values():
+            tab.close()
+        self.__tabs.clear()
+        self.__root.destroy()
+
+
+class _QueryTab:
+    """
+        A single query tab with its own query editor, result table and pooled database connection.
+
+        Database work runs on a worker thread; its outcome is handed back to the Tkinter main loop through a queue,
+        so a long query or export in one tab does not block the others.
+    """
+
+    __POLL_INTERVAL_MS = 50
+
+    def __init__(self, root, notebook, title, psql_connection, memory_budget, plan_history):
+        """
+                Initializes the tab's GUI components and adds the tab to the notebook.
+
+                Args:
+                    root: The root Tkinter widget.
+                    notebook (ttk.Notebook): The notebook the tab is added to.
+                    title (str): The tab caption.
+                    psql_connection (PsqlConnection): The connection owned by this tab.
+                    memory_budget (ResultMemoryBudget): The memory budget shared by the results of all tabs.
+                    plan_history (PlanHistory): The profiled plans shared by all tabs.
         """
         self.__row_limit = None
         self.__current_query = None
         self.__root = root
+        self.__notebook = notebook
+        self.__title = title
         self.__psql_connection = psql_connection
+        self.__memory_budget = memory_budget
+        self.__plan_history = plan_history
+        self.__profile_window = None
         self.__current_page = 0
         self.__rows_per_page = 100
         self.__total_rows = 0
         self.__loaded_rows = 0
         self.__result_df = None
-
-        self.__root.title("PSQLVue UI Executor")
-        self.__context_menu = tk.Menu(root, tearoff=0)
-        self.__query_input = tk.Text(self.__root, height=10, undo=True)
+        self.__is_busy = False
+        self.__is_closed = False
+        self.__is_running = False
+        self.__worker_lock = threading.Lock()
+        self.__background_results = queue.Queue()
+
+        self.__frame = tk.Frame(self.__notebook)
+        self.__query_input = tk.Text(self.__frame, height=10, undo=True)
         self.__autocommit_var = tk.BooleanVar(value=False)
-        self.__autocommit_checkbox = tk.Checkbutton(self.__root, text="Autocommit", variable=self.__autocommit_var)
-        self.__execute_button = tk.Button(self.__root, text="Execute", command=self.__execute_query)
-        self.__export_button = tk.Button(self.__root, text="Export Data", command=self.__export_data)
+        self.__autocommit_checkbox = tk.Checkbutton(self.__frame, text="Autocommit", variable=self.__autocommit_var)
+        self.__execute_button = tk.Button(self.__frame, text="Execute", command=self.__execute_query)
+        self.__profile_button = tk.Button(self.__frame, text="Profile", command=self.__profile_query)
+        self.__export_button = tk.Button(self.__frame, text="Export Data", command=self.__export_data)
         self.__all_data_var = tk.BooleanVar(value=False)
-        self.__all_data_checkbox = tk.Checkbutton(self.__root, text="Export all data", variable=self.__all_data_var)
-        self.__tree_frame = tk.Frame(self.__root)
+        self.__all_data_checkbox = tk.Checkbutton(self.__frame, text="Export all data", variable=self.__all_data_var)
+        self.__tree_frame = tk.Frame(self.__frame)
         self.__tree_scroll = tk.Scrollbar(self.__tree_frame)
-        self.__info_label = tk.Label(self.__root, text="Loaded rows: 0")
-        self.__descr_buffer_label = tk.Label(self.__root,
+        self.__info_label = tk.Label(self.__frame, text="Loaded rows: 0")
+        self.__descr_buffer_label = tk.Label(self.__frame,
                                              text="* If data from the clipboard does not paste into the SQL query "
                                                   "input field, try changing the keyboard layout and "
                                                   "try pasting the data again.")
@@ -48,6 +176,15 @@ class PsqlGuiApp:
                                           selectmode="extended")
 
         self.__setup_ui()
+        self.__notebook.add(self.__frame, text=self.__title)
+
+    @property
+    def frame(self):
+        return self.__frame
+
+    @property
+    def query_input(self):
+        return self.__query_input
 
     @staticmethod
     def __show_context_menu(event, menu):
@@ -77,29 +214,25 @@ class PsqlGuiApp:
 
     def __setup_ui(self):
         """
-            Sets up the user interface components and their layout within the main application window.
+            Sets up the user interface components and their layout within the tab.
         """
-        query_input_context_menu = tk.Menu(self.__root, tearoff=0)
+        query_input_context_menu = tk.Menu(self.__frame, tearoff=0)
         query_input_context_menu.add_command(label="Copy",
                                              command=lambda: self.__query_input.event_generate('<<Copy>>'))
         query_input_context_menu.add_command(label="Cut", command=lambda: self.__query_input.event_generate('<<Cut>>'))
         query_input_context_menu.add_command(label="Paste",
                                              command=lambda: self.__query_input.event_generate('<<Paste>>'))
 
-        result_tree_context_menu = tk.Menu(self.__root, tearoff=0)
+        result_tree_context_menu = tk.Menu(self.__frame, tearoff=0)
         result_tree_context_menu.add_command(label="Copy", command=self.__copy_selected_result)
 
         self.__query_input.bind("<Button-3>", lambda event: self.__show_context_menu(event, query_input_context_menu))
         self.__result_tree.bind("<Button-3>", lambda event: self.__show_context_menu(event, result_tree_context_menu))
 
-        self.__root.bind_all("<Control-z>", lambda event: self.__query_input.edit_undo())
-        self.__root.bind_all("<Control-y>", lambda event: self.__query_input.edit_redo())
-        self.__root.bind_all("<Control-c>", lambda event: self.__query_input.event_generate('<<Copy>>'))
-        self.__root.bind_all("<Control-x>", lambda event: self.__query_input.event_generate('<<Cut>>'))
-
         self.__query_input.pack(fill=tk.X, padx=5, pady=5)
         self.__descr_buffer_label.pack(anchor='w', padx=3)
         self.__execute_button.pack(pady=5)
+        self.__profile_button.pack(pady=5)
         self.__autocommit_checkbox.pack(pady=5)
         self.__export_button.pack(pady=5)
         self.__all_data_checkbox.pack(pady=5)
@@ -111,11 +244,97 @@ class PsqlGuiApp:
         self.__tree_scroll.config(command=self.__result_tree.yview)
         self.__result_tree.pack(fill=tk.BOTH, expand=True)
 
-        self.__root.grid_rowconfigure(0, weight=1)
-        self.__root.grid_columnconfigure(0, weight=1)
-
         self.__result_tree.bind('<MouseWheel>', self.__on_motion)
 
+    def close(self):
+        """
+            Releases the tab's result memory and returns its connection to the pool.
+
+            A statement still running in the background is cancelled instead, and the worker returns the connection
+            once it has finished, so closing never waits on the main thread.
+        """
+        self.__result_df = None
+        self.__memory_budget.release(self)
+
+        if self.__profile_window is not None and self.__profile_window.winfo_exists():
+            self.__profile_window.destroy()
+
+        with self.__worker_lock:
+            self.__is_closed = True
+            if self.__is_running:
+                self.__psql_connection.cancel()
+                return
+
+        self.__psql_connection.close()
+
+    def __run_in_background(self, task, on_done):
+        """
+            Runs a database task on a worker thread and hands its result to a callback on the Tkinter main loop.
+
+            Args:
+                task: A callable executed on the worker thread. It must not touch any Tkinter widget.
+                on_done: A callable invoked on the main thread with the value returned by the task.
+        """
+        self.__set_busy(True)
+
+        def worker():
+            try:
+                self.__background_results.put((on_done, task()))
+            except Exception as e:
+                logging.error(f"Error: {e}")
+                self.__background_results.put((self.__show_background_error, f'Error: {e}'))
+            finally:
+                with self.__worker_lock:
+                    self.__is_running = False
+                    is_closed = self.__is_closed
+
+                if is_closed:
+                    self.__psql_connection.close()
+
+        self.__is_running = True
+        threading.Thread(target=worker, daemon=True).start()
+        self.__root.after(self.__POLL_INTERVAL_MS, self.__poll_background)
+
+    def __poll_background(self):
+        """
+            Checks whether the running background task has finished and dispatches its result.
+        """
+        try:
+            on_done, result = self.__background_results.get_nowait()
+        except queue.Empty:
+            self.__root.after(self.__POLL_INTERVAL_MS, self.__poll_background)
+            return
+
+        if self.__is_closed:
+            return
+
+        self.__set_busy(False)
+        on_done(result)
+
+    @staticmethod
+    def __show_background_error(error: str):
+        messagebox.showerror("Error", error)
+
+    def __set_busy(self, is_busy: bool):
+        """
+            Marks the tab as running or idle and updates its controls accordingly.
+
+            Args:
+                is_busy (bool): Whether a background task is running.
+        """
+        self.__is_busy = is_busy
+        state = tk.DISABLED if is_busy else tk.NORMAL
+        self.__execute_button.config(state=state)
+        self.__profile_button.config(state=state)
+        self.__export_button.config(state=state)
+        self.__notebook.tab(self.__frame, text=f"{self.__title} (running)" if is_busy else self.__title)
+
+    def __budget_exceeded_message(self) -> str:
+        limit_mb = self.__memory_budget.limit_bytes / (1024 * 1024)
+        used_mb = self.__memory_budget.used_bytes / (1024 * 1024)
+        return (f"The result does not fit into the result memory budget ({used_mb:.1f}/{limit_mb:.1f} MB in use). "
+                f"Close other tabs or narrow the query.")
+
     def __on_motion(self, event):
         """
             Handles mouse wheel motion to load more data when the end of the scrollbar is reached.
@@ -128,59 +347,160 @@ class PsqlGuiApp:
 
     def __next_page(self):
         """
-            Fetches the next page of data based on the current query, pagination settings, and updates the UI accordingly.
+            Fetches the next page of data in the background based on the current query and pagination settings.
+        """
+        if self.__is_busy or self.__loaded_rows >= self.__total_rows:
+            return
+
+        query = self.__current_query
+        is_autocommit = self.__autocommit_var.get()
+        offset = self.__loaded_rows
+        limit = self.__rows_per_page
+
+        self.__run_in_background(
+            lambda: self.__psql_connection.fetch_data(query, is_autocommit=is_autocommit, offset=offset, limit=limit),
+            self.__on_page_fetched
+        )
+
+    def __on_page_fetched(self, new_data):
+        """
+            Appends a fetched page to the result table if it fits into the memory budget.
+
+            A page that does not fit is dropped for this attempt only; scrolling to the end again retries it, so
+            paging resumes once other tabs free their memory.
+
+            Args:
+                new_data: The fetched page, or an error message.
         """
-        if self.__loaded_rows < self.__total_rows:
-            new_data = self.__psql_connection.fetch_data(
-                self.__current_query,
-                is_autocommit=self.__autocommit_var.get(),
-                offset=self.__loaded_rows,
-                limit=self.__rows_per_page
-            )
+        if isinstance(new_data, pd.DataFrame) and not new_data.empty:
+            if not self.__memory_budget.reserve(self, ResultMemoryBudget.measure(new_data)):
+                self.__info_label.config(text=f"Loaded rows: {self.__loaded_rows}/{self.__total_rows} "
+                                              f"(result memory budget reached, scroll again to retry)")
+                return
 
-            if isinstance(new_data, pd.DataFrame) and not new_data.empty:
-                self.__result_df = pd.concat([self.__result_df, new_data], ignore_index=True)
-                self.__update_table(self.__rows_per_page, load_more=True)
+            self.__result_df = pd.concat([self.__result_df, new_data], ignore_index=True)
+            self.__update_table(self.__rows_per_page, load_more=True)
+        elif isinstance(new_data, str):
+            messagebox.showerror("Error", new_data)
 
     def __execute_query(self):
         """
-                Executes the SQL query specified in the query input box and displays the results.
+                Executes the SQL query specified in the query input box in the background and displays the results.
         """
         query = self.__query_input.get("1.0", tk.END).strip()
         if not query:
             messagebox.showinfo("Info", "Please enter a query to execute.")
             return
 
-        self.__current_query = query
+        if self.__is_busy:
+            return
+
+        if query.lower().startswith('show ') and self.__psql_connection.is_in_transaction():
+            proceed = messagebox.askokcancel("",
+                                             "You are attempting to execute a SHOW query in the database. "
+                                             "However, the current session has an uncommitted transaction. "
+                                             "Press Ok to COMMIT this transaction "
+                                             "or Cancel to perform its ROLLBACK.")
+            if proceed:
+                self.__psql_connection.commit()
+            else:
+                self.__psql_connection.rollback()
 
-        self.__total_rows = self.__psql_connection.fetch_data(query, count_only=True)
+        is_autocommit = self.__autocommit_var.get()
+        rows_per_page = self.__rows_per_page
 
-        if isinstance(self.__total_rows, str):
-            messagebox.showerror("Error", self.__total_rows)
-            return
-        elif isinstance(self.__total_rows, tuple):
-            result = self.__total_rows[1]
-            self.__total_rows = self.__total_rows[0]
-            total_rows = self.__total_rows
-        else:
-            self.__loaded_rows = 0
-            result = self.__psql_connection.fetch_data(query, is_autocommit=self.__autocommit_var.get(), limit=100,
+        def fetch():
+            total_rows = self.__psql_connection.fetch_data(query, count_only=True)
+
+            if isinstance(total_rows, str):
+                return total_rows
+            elif isinstance(total_rows, tuple):
+                return total_rows[0], total_rows[1], total_rows[0]
+
+            result = self.__psql_connection.fetch_data(query, is_autocommit=is_autocommit, limit=rows_per_page,
                                                        offset=0)
-            total_rows = self.__rows_per_page
+            return total_rows, result, rows_per_page
+
+        self.__run_in_background(fetch, lambda outcome: self.__on_query_executed(query, outcome))
+
+    def __on_query_executed(self, query: str, outcome):
+        """
+            Displays the outcome of an executed query.
+
+            Args:
+                query (str): The executed query.
+                outcome: A (total rows, first page, rows to show) tuple, or an error message.
+        """
+        if isinstance(outcome, str):
+            messagebox.showerror("Error", outcome)
+            return
+
+        self.__current_query = query
+        self.__total_rows, result, total_rows = outcome
 
         if isinstance(result, pd.DataFrame):
-            self.__result_df = result
+            self.__result_df = None
+            self.__memory_budget.release(self)
             self.__current_page = 0
             self.__loaded_rows = 0
             self.__result_tree.yview_moveto(0)
             for i in self.__result_tree.get_children():
                 self.__result_tree.delete(i)
+
+            if not self.__memory_budget.reserve(self, ResultMemoryBudget.measure(result)):
+                self.__info_label.config(text="Loaded rows: 0")
+                messagebox.showerror("Error", self.__budget_exceeded_message())
+                return
+
+            self.__result_df = result
             self.__update_table(loaded_rows=total_rows)
         elif isinstance(result, str):
             messagebox.showerror("Error", result)
         else:
             messagebox.showinfo("Result", "The query executed successfully but returned no data.")
 
+    def __profile_query(self):
+        """
+            Profiles the SQL query from the query input box with EXPLAIN ANALYZE in the background.
+        """
+        query = self.__query_input.get("1.0", tk.END).strip()
+        if not query:
+            messagebox.showinfo("Info", "Please enter a query to profile.")
+            return
+
+        if self.__is_busy:
+            return
+
+        self.__run_in_background(lambda: self.__psql_connection.explain_analyze(query),
+                                 lambda outcome: self.__on_query_profiled(query, outcome))
+
+    def __on_query_profiled(self, query: str, outcome):
+        """
+            Records the profiled plan and shows it next to the previous run of the same query.
+
+            Args:
+                query (str): The profiled query.
+                outcome: The decoded EXPLAIN JSON output, or an error message.
+        """
+        if isinstance(outcome, str):
+            messagebox.showerror("Error", outcome)
+            return
+
+        try:
+            plan = ExplainPlan(outcome)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            logging.error(f"Unable to parse the query plan: {e}")
+            messagebox.showerror("Error", f"Unable to parse the query plan: {e}")
+            return
+
+        self.__plan_history.add(query, plan)
+
+        if self.__profile_window is None or not self.__profile_window.winfo_exists():
+            self.__profile_window = _ProfileWindow(self.__root, f"{self.__title} - Profile")
+
+        self.__profile_window.show_runs(self.__plan_history.runs(query))
+        self.__profile_window.lift()
+
     def __update_table(self, loaded_rows: int, load_more=False):
         if self.__result_df is not None and not self.__result_df.empty:
             if not load_more:
@@ -208,11 +528,17 @@ class PsqlGuiApp:
     def __export_data(self):
         """
             Initiates the export process for the currently loaded data or all data based on user selection.
+
+            The export parameters are asked for here; fetching, splitting and writing run in the background.
+            Exports of all data are streamed chunk by chunk, so they are not accounted in the result memory budget.
         """
         if self.__result_df is None or self.__result_df.empty:
             messagebox.showerror("Error", "Nothing to export!")
             return
 
+        if self.__is_busy:
+            return
+
         file_path = filedialog.asksaveasfilename(
             defaultextension='.csv',
             filetypes=[("CSV files", '*.csv')],
@@ -222,122 +548,214 @@ class PsqlGuiApp:
         if not file_path:
             return
 
-        if self.__all_data_var.get():
-            dialog = _ExportDialog(self.__root, "Export Parameters")
-            if not hasattr(dialog, 'result'):
-                messagebox.showerror("Export", "Export config is not set.")
-                return
+        if not self.__all_data_var.get():
+            result_df = self.__result_df
 
-            file_size, file_rows, row_limit, row_offset = dialog.result
-            download_all_data = row_limit is None and row_offset is None
+            def export_loaded_data():
+                with CsvPartWriter(file_path) as writer:
+                    writer.write(result_df)
+                return writer.rows_written, writer.part_count
 
-            all_data = self.__psql_connection.fetch_data(self.__current_query, is_autocommit=self.__autocommit_var,
-                                                         offset=row_offset, limit=row_limit, all_data=download_all_data)
-        else:
-            if self.__result_df.empty:
-                messagebox.showerror("Export", "No data to export.")
-                return
-            else:
-                self.__result_df.to_csv(file_path, index=False)
-                messagebox.showinfo("Export", f"Data successfully exported.")
-                return
-
-        if all_data.empty:
-            messagebox.showerror("Export", "No data to export.")
+            self.__run_in_background(export_loaded_data, self.__on_data_exported)
             return
 
-        if file_size is None and file_rows is None:
-            all_data.to_csv(file_path, index=False)
-            messagebox.showinfo("Export", "Data successfully exported.")
+        dialog = _ExportDialog(self.__root, "Export Parameters")
+        if not hasattr(dialog, 'result'):
+            messagebox.showerror("Export", "Export config is not set.")
             return
-        elif file_size is not None:
-            self.__export_by_file_size(all_data, file_size, file_path)
-        else:
-            self.__export_by_file_rows(all_data, file_rows, file_path)
+
+        file_size, file_rows, row_limit, row_offset = dialog.result
+
+        if file_rows and isinstance(self.__total_rows, int):
+            export_rows = max(self.__total_rows - (row_offset or 0), 0)
+            if row_limit is not None:
+                export_rows = min(export_rows, row_limit)
+
+            estimated_file_count = export_rows // file_rows + (1 if export_rows % file_rows else 0)
+            if estimated_file_count > 1:
+                proceed = messagebox.askokcancel("Export Confirmation",
+                                                 f"Will be created {estimated_file_count} files. Proceed?")
+                if not proceed:
+                    return
+
+        query = self.__current_query
+        is_autocommit = self.__autocommit_var.get()
+
+        def export_all_data():
+            with CsvPartWriter(file_path, max_file_size=file_size, max_file_rows=file_rows) as writer:
+                outcome = self.__psql_connection.stream_data(query, writer.write, is_autocommit=is_autocommit,
+                                                             offset=row_offset, limit=row_limit)
+            return outcome if isinstance(outcome, str) else (writer.rows_written, writer.part_count)
+
+        self.__run_in_background(export_all_data, self.__on_data_exported)
 
     @staticmethod
-    def __export_by_file_rows(all_data: DataFrame, file_rows: int, file_path: str):
+    def __on_data_exported(outcome):
         """
-            Splits and exports the data into multiple CSV files based on the specified number of rows per file.
+            Reports the outcome of a finished export.
 
             Args:
-                all_data (DataFrame): The DataFrame containing all the data to be exported.
-                file_rows (int): The maximum number of rows per file.
-                file_path (str): The base file path for the exported CSV files.
+                outcome: A (written rows, created files) tuple, or an error message.
         """
-        total_rows = len(all_data)
-        estimated_file_count = int(total_rows // file_rows + (1 if total_rows % file_rows else 0))
+        if isinstance(outcome, str):
+            messagebox.showerror("Export", outcome)
+            return
 
-        if estimated_file_count > 1:
-            proceed = messagebox.askokcancel("Export Confirmation",
-                                             f"Will be created {estimated_file_count} files. Proceed?")
-            if not proceed:
-                return
+        rows_written, part_count = outcome
+        if not rows_written:
+            messagebox.showerror("Export", "No data to export.")
+            return
 
-        part_number = 1
-        for start in range(0, total_rows, file_rows):
-            end = min(start + file_rows, total_rows)
-            part_df = all_data.iloc[start:end]
+        messagebox.showinfo("Export", "Data successfully exported." + (
+            f" Created {part_count} file(s)." if part_count > 1 else ""))
 
-            part_file_path = f"{file_path.rsplit('.', 1)[0]}_part{part_number}.csv" if part_number > 1 else file_path
-            part_df.to_csv(part_file_path, index=False)
 
-            part_number += 1
+class _ProfileWindow(tk.Toplevel):
+    """
+        A window showing two profiled runs of the same query side by side.
+    """
 
-        messagebox.showinfo("Export", f"Data successfully exported." + (
-            f" Created {part_number - 1} file(s)." if part_number > 1 else ""))
+    def __init__(self, master, title):
+        """
+                Creates the window with two empty plan views.
 
-    @staticmethod
-    def __export_by_file_size(all_data: DataFrame, file_size: float, file_path: str):
+                Args:
+                    master: The parent window.
+                    title (str): The window title.
         """
-            Splits and exports the data into multiple CSV files based on the specified maximum file size.
+        super().__init__(master)
+        self.title(title)
+        self.geometry("1400x600")
+
+        panes = tk.PanedWindow(self, orient=tk.HORIZONTAL, sashrelief=tk.RAISED)
+        self.__left_view = _PlanView(panes)
+        self.__right_view = _PlanView(panes)
+        panes.add(self.__left_view, stretch="always")
+        panes.add(self.__right_view, stretch="always")
+        panes.pack(fill=tk.BOTH, expand=True)
+
+    def show_runs(self, runs: list):
+        """
+                Shows the latest run on the left and the run before it on the right.
 
-            Args:
-                all_data (DataFrame): The DataFrame containing all the data to be exported.
-                file_size (float): The maximum file size in megabytes.
-                file_path (str): The base file path for the exported CSV files.
+                Args:
+                    runs (list): The ExplainPlan runs of the query, oldest first.
         """
-        header = all_data.iloc[:0].to_csv(index=False)
+        self.__left_view.set_runs(runs, len(runs) - 1)
+        self.__right_view.set_runs(runs, max(len(runs) - 2, 0))
 
-        max_size_bytes = file_size * 1024 * 1024
-        part_number = 1
 
-        buffer = io.StringIO()
-        all_data.to_csv(buffer, index=False)
-        total_data_size = buffer.tell()
-        buffer.seek(0)
-        current_size = 0
+class _PlanView(tk.Frame):
+    """
+        A collapsible plan tree of one profiled run with the most expensive nodes highlighted.
+    """
 
-        estimated_file_count = int(total_data_size // max_size_bytes + (1 if total_data_size % max_size_bytes else 0))
+    __MISESTIMATE_WARNING = 10
 
-        if estimated_file_count > 1:
-            proceed = messagebox.askokcancel("Export Confirmation",
-                                             f"Will be created {estimated_file_count} files. Proceed?")
-            if not proceed:
-                return
+    def __init__(self, master):
+        """
+                Creates the run selector, the plan summary and the plan tree.
+
+                Args:
+                    master: The parent widget.
+        """
+        super().__init__(master)
+        self.__runs = []
+
+        self.__run_var = tk.StringVar()
+        self.__run_selector = ttk.Combobox(self, textvariable=self.__run_var, state="readonly")
+        self.__summary_label = tk.Label(self, anchor='w')
+        tree_frame = tk.Frame(self)
+        tree_scroll = tk.Scrollbar(tree_frame)
+        self.__plan_tree = ttk.Treeview(tree_frame, yscrollcommand=tree_scroll.set, show="tree headings",
+                                        columns=("self_time", "self_share", "total_time", "rows", "misestimate",
+                                                 "shared_hit", "shared_read"))
+
+        self.__plan_tree.heading("#0", text="Node")
+        self.__plan_tree.column("#0", width=300)
+        for column, text in (("self_time", "Self, ms"), ("self_share", "Self, %"), ("total_time", "Total, ms"),
+                             ("rows", "Rows (actual / planned)"), ("misestimate", "Misestimate"),
+                             ("shared_hit", "Self shared hit"), ("shared_read", "Self shared read")):
+            self.__plan_tree.heading(column, text=text)
+            self.__plan_tree.column(column, width=80, anchor='e')
+
+        self.__plan_tree.tag_configure('hottest', background='#ff8a80')
+        self.__plan_tree.tag_configure('hot', background='#ffe0b2')
+        self.__plan_tree.tag_configure('misestimate', foreground='#c62828')
+
+        self.__run_selector.bind('<<ComboboxSelected>>', lambda event: self.__show_run(self.__run_selector.current()))
+
+        self.__run_selector.pack(fill=tk.X, padx=5, pady=5)
+        self.__summary_label.pack(fill=tk.X, padx=5)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        tree_scroll.config(command=self.__plan_tree.yview)
+        self.__plan_tree.pack(fill=tk.BOTH, expand=True)
+
+    def set_runs(self, runs: list, selected: int):
+        """
+                Fills the run selector and shows one of the runs.
 
-        part_file_path = file_path
+                Args:
+                    runs (list): The ExplainPlan runs of the query, oldest first.
+                    selected (int): The index of the run to show.
+        """
+        self.__runs = runs
+        self.__run_selector["values"] = [f"Run {number}: {plan.execution_time:.2f} ms at "
+                                         f"{plan.captured_at:%H:%M:%S}" for number, plan in enumerate(runs, 1)]
+        self.__run_selector.current(selected)
+        self.__show_run(selected)
+
+    def __show_run(self, index: int):
+        """
+                Renders the plan tree of a run.
 
-        is_first_line = False
-        for line in buffer:
-            line_size = len(line.encode('utf-8'))
-            if current_size + line_size > max_size_bytes and max_size_bytes > 0:
-                is_first_line = True
-                part_number += 1
-                part_file_path = f"{file_path.rsplit('.', 1)[0]}_part{part_number}.csv"
-                current_size = 0
+                Args:
+                    index (int): The index of the run to show.
+        """
+        plan = self.__runs[index]
+        hot_spots = plan.hot_spots()
 
-            with open(part_file_path, 'a', encoding='utf-8', newline='') as file:
-                if is_first_line:
-                    file.write(header + line)
-                else:
-                    file.write(line)
+        self.__summary_label.config(text=f"Planning: {plan.planning_time:.2f} ms | "
+                                         f"Execution: {plan.execution_time:.2f} ms | "
+                                         f"Hot spots: {len(hot_spots)}")
 
-                is_first_line = False
-                current_size += line_size
+        for i in self.__plan_tree.get_children():
+            self.__plan_tree.delete(i)
 
-        messagebox.showinfo("Export", f"Data successfully exported." + (
-            f" Created {part_number} file(s)." if part_number > 1 else ""))
+        self.__insert_node("", plan.root, plan, hot_spots)
+
+    def __insert_node(self, parent: str, node, plan, hot_spots: list):
+        """
+                Inserts a plan node and its subtree into the plan tree.
+
+                Args:
+                    parent (str): The parent tree item, "" for the root.
+                    node (PlanNode): The node to insert.
+                    plan (ExplainPlan): The plan the node belongs to.
+                    hot_spots (list): The plan's hot nodes, most expensive first.
+        """
+        tags = []
+        if hot_spots and node is hot_spots[0]:
+            tags.append('hottest')
+        elif node in hot_spots:
+            tags.append('hot')
+        if node.misestimate >= self.__MISESTIMATE_WARNING:
+            tags.append('misestimate')
+
+        text = node.description if node.was_executed else f"{node.description} (never executed)"
+        item = self.__plan_tree.insert(parent, "end", text=text, open=True, tags=tags, values=(
+            f"{node.self_time:.2f}",
+            f"{plan.self_time_share(node) * 100:.1f}",
+            f"{node.total_time:.2f}",
+            f"{int(node.actual_rows)} / {int(node.plan_rows)}",
+            f"x{node.misestimate:.1f}",
+            node.shared_hit_blocks,
+            node.shared_read_blocks
+        ))
+
+        for child in node.children:
+            self.__insert_node(item, child, plan, hot_spots)
 
 
 class _ExportDialog(simpledialog.Dialog):
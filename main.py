@@ -1,5 +1,6 @@
 import argparse
-from psql_connection import PsqlConnection
+from psql_connection import PsqlConnectionPool
+from result_memory_budget import ResultMemoryBudget
 from web_interface import app as flask_app
 import threading
 import tkinter as tk
@@ -18,6 +19,10 @@ def main():
     parser.add_argument("-d", "--db", required=True, help="Database name")
     parser.add_argument("-i", "--interface", choices=['gui', 'http'], required=True,
                         help="Interface mode (GUI or HTTP)")
+    parser.add_argument("-c", "--max-connections", default=5, type=positive_int,
+                        help="Maximum number of pooled database connections (one per GUI query tab)")
+    parser.add_argument("-m", "--memory-budget", default=1024, type=non_negative_int,
+                        help="Memory budget in MB for query results across all GUI tabs (0 for unlimited)")
 
     args = parser.parse_args()
 
@@ -29,12 +34,53 @@ def main():
         "db": args.db
     }
 
-    psql_connection = PsqlConnection(db_params)
+    connection_pool = PsqlConnectionPool(db_params, max_connections=args.max_connections)
 
     if args.interface == 'http':
-        threading.Thread(target=start_web_app, args=(psql_connection,)).start()
+        threading.Thread(target=start_web_app, args=(connection_pool.acquire(),)).start()
     elif args.interface == 'gui':
-        start_gui_app(psql_connection)
+        try:
+            start_gui_app(connection_pool, ResultMemoryBudget(args.memory_budget * 1024 * 1024))
+        finally:
+            connection_pool.close()
+
+
+def positive_int(value):
+    """
+        Parses a command line value as an integer greater than zero.
+
+        Args:
+            value (str): The raw command line value.
+
+        Returns:
+            int: The parsed value.
+
+        Raises:
+            argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def non_negative_int(value):
+    """
+        Parses a command line value as an integer greater than or equal to zero.
+
+        Args:
+            value (str): The raw command line value.
+
+        Returns:
+            int: The parsed value.
+
+        Raises:
+            argparse.ArgumentTypeError: If the value is negative.
+    """
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a non-negative integer")
+    return number
 
 
 def start_web_app(psql_connection):
@@ -48,15 +94,16 @@ def start_web_app(psql_connection):
     flask_app.run(debug=True)
 
 
-def start_gui_app(psql_connection):
+def start_gui_app(connection_pool, memory_budget):
     """
         Starts the GUI interface of the application.
 
         Args:
-            psql_connection (PsqlConnection): An instance of PsqlConnection to be used by the Tkinter GUI app.
+            connection_pool (PsqlConnectionPool): The pool the GUI query tabs check their connections out from.
+            memory_budget (ResultMemoryBudget): The memory budget shared by the results of all GUI query tabs.
     """
     root = tk.Tk()
-    PsqlGuiApp(root, psql_connection)
+    PsqlGuiApp(root, connection_pool, memory_budget)
     root.mainloop()
 
 
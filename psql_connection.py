@@ -1,11 +1,96 @@
 import os
-from tkinter import messagebox
+import re
+import threading
 
 import psycopg2
+import psycopg2.pool
 import pandas as pd
 import logging
 
 
+_DOLLAR_QUOTE = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)?\$")
+
+
+def _follows_identifier(query: str, position: int) -> bool:
+    return position > 0 and (query[position - 1].isalnum() or query[position - 1] == '_')
+
+
+def split_statements(query: str) -> list:
+    """
+        Splits SQL text into its statements at semicolons outside of literals, quoted identifiers and comments.
+
+        Args:
+            query (str): The SQL text.
+
+        Returns:
+            list: The stripped statements without their terminating semicolons. Segments holding only whitespace
+                or comments are left out.
+    """
+    statements = []
+    start = 0
+    has_code = False
+    i = 0
+
+    while i < len(query):
+        char = query[i]
+
+        if char == "'":
+            escaped = i > 0 and query[i - 1] in "eE" and not _follows_identifier(query, i - 1)
+            i += 1
+            while i < len(query):
+                if escaped and query[i] == "\\":
+                    i += 2
+                    continue
+                if query[i] == "'":
+                    if query.startswith("''", i):
+                        i += 2
+                        continue
+                    break
+                i += 1
+            has_code = True
+        elif char == '"':
+            end = query.find('"', i + 1)
+            while end != -1 and query.startswith('""', end):
+                end = query.find('"', end + 2)
+            i = len(query) if end == -1 else end
+            has_code = True
+        elif query.startswith("--", i):
+            end = query.find("\n", i)
+            i = len(query) if end == -1 else end
+        elif query.startswith("/*", i):
+            depth = 1
+            i += 2
+            while i < len(query) and depth:
+                if query.startswith("/*", i):
+                    depth += 1
+                    i += 2
+                elif query.startswith("*/", i):
+                    depth -= 1
+                    i += 2
+                else:
+                    i += 1
+            continue
+        elif char == "$" and _DOLLAR_QUOTE.match(query, i) and not _follows_identifier(query, i):
+            tag = _DOLLAR_QUOTE.match(query, i).group(0)
+            end = query.find(tag, i + len(tag))
+            i = len(query) if end == -1 else end + len(tag) - 1
+            has_code = True
+        elif char == ";":
+            if has_code:
+                statements.append(query[start:i].strip())
+            start = i + 1
+            has_code = False
+        elif not char.isspace():
+            has_code = True
+
+        i += 1
+
+    if has_code:
+        statements.append(query[start:].strip())
+
+    return statements
+
+
 class PsqlConnection:
     """
         Manages the connection to a PostgreSQL database, allowing for executing queries and fetching data.
@@ -14,15 +99,31 @@ class PsqlConnection:
             __connection: A psycopg2 connection object to the database.
     """
 
-    def __init__(self, db_params):
+    __PROFILE_SAVEPOINT = "psqlvue_profile"
+    __STREAM_CURSOR = "psqlvue_stream"
+    __CANCELLED_MESSAGE = 'Error: The operation was cancelled.'
+    __DECLARABLE_KEYWORDS = ('select', 'values', 'table', 'with')
+
+    def __init__(self, db_params=None, connection_pool=None):
         """
                 Initializes the database connection using provided parameters.
 
                 Args:
-                    db_params (dict): Database connection parameters including host, port, user, password, and dbname.
+                    db_params (dict, optional): Database connection parameters including host, port, user, password,
+                        and dbname. Used when no connection pool is given.
+                    connection_pool (psycopg2.pool.AbstractConnectionPool, optional): A pool to check the connection
+                        out from. The connection is returned to the pool on close().
         """
-        self.__connection = self.__connect_to_db(db_params)
+        self.__connection_pool = connection_pool
+
+        if connection_pool is not None:
+            self.__connection = connection_pool.getconn()
+            self.__connection.autocommit = False
+        else:
+            self.__connection = self.__connect_to_db(db_params)
+
         self.__cursor = self.__connection.cursor()
+        self.__cancel_requested = threading.Event()
 
     @staticmethod
     def __connect_to_db(db_params):
@@ -69,24 +170,21 @@ class PsqlConnection:
                     pandas.DataFrame: The fetched data as a DataFrame.
                     str: An error message if an error occurs.
         """
+        if self.__cancel_requested.is_set():
+            return self.__CANCELLED_MESSAGE
+
         if query.lower().startswith('show '):
             return self.__use_non_statement_mode_query(query)
         else:
             return self.__use_statement_mode_query(query, is_autocommit, offset, limit, all_data, count_only)
 
     def __use_non_statement_mode_query(self, query: str):
-        try:
-            if self.__connection.status == psycopg2.extensions.STATUS_BEGIN:
-                proceed = messagebox.askokcancel("",
-                                                 "You are attempting to execute a SHOW query in the database. "
-                                                 "However, the current session has an uncommitted transaction. "
-                                                 "Press Ok to COMMIT this transaction "
-                                                 "or Cancel to perform its ROLLBACK.")
-                if proceed:
-                    self.__connection.commit()
-                else:
-                    self.__connection.rollback()
+        if self.is_in_transaction():
+            logging.error("SHOW query rejected: the session has an uncommitted transaction")
+            return ('Error: The current session has an uncommitted transaction. '
+                    'COMMIT or ROLLBACK it before executing a SHOW query.')
 
+        try:
             self.__connection.autocommit = True
             self.__cursor.execute(query)
             self.__connection.autocommit = False
@@ -135,14 +233,7 @@ class PsqlConnection:
                 return f'Error: {e}'
 
         else:
-            if all_data:
-                paginated_query = query
-            elif offset is not None and limit is not None:
-                paginated_query = f"{query} LIMIT {limit} OFFSET {offset}"
-            elif offset is not None:
-                paginated_query = f"{query} OFFSET {offset}"
-            else:
-                paginated_query = f"{query} LIMIT {limit}"
+            paginated_query = self.__paginate(query, offset, limit, all_data)
 
         try:
             self.__cursor.execute(paginated_query)
@@ -172,7 +263,318 @@ class PsqlConnection:
             self.__connection.rollback()
             return f'Error: {e}'
 
-    def close(self):
+    @staticmethod
+    def __paginate(query: str, offset: int, limit: int, all_data: bool) -> str:
+        if all_data:
+            return query
+        elif offset is not None and limit is not None:
+            return f"{query} LIMIT {limit} OFFSET {offset}"
+        elif offset is not None:
+            return f"{query} OFFSET {offset}"
+        else:
+            return f"{query} LIMIT {limit}"
+
+    def stream_data(self, query: str, on_chunk, is_autocommit: bool = False, offset: int = None, limit: int = None,
+                    chunk_size: int = 10000):
+        """
+                Executes a query through a server-side cursor and hands the rows over in chunks,
+                so that only one chunk is held in memory at a time.
+
+                Queries a cursor cannot be declared for, such as SHOW, are fetched at once through fetch_data()
+                and handed over as a single chunk.
+
+                Args:
+                    query (str): The SQL query to execute.
+                    on_chunk: A callable receiving each chunk as a pandas.DataFrame.
+                    is_autocommit (bool): Whether to autocommit the transaction.
+                    offset (int, optional): The offset from where to start fetching rows.
+                    limit (int, optional): The maximum number of rows to fetch.
+                    chunk_size (int): The number of rows fetched per round trip.
+
+                Returns:
+                    int: The number of streamed rows.
+                    str: An error message if an error occurs or the stream was cancelled.
+        """
+        if self.__cancel_requested.is_set():
+            return self.__CANCELLED_MESSAGE
+
+        if not self.__is_declarable(query):
+            return self.__fetch_as_single_chunk(query, on_chunk, is_autocommit, offset, limit)
+
+        paginated_query = self.__paginate(query, offset, limit, all_data=offset is None and limit is None)
+
+        try:
+            cursor = self.__connection.cursor(name=self.__STREAM_CURSOR)
+            cursor.execute(paginated_query)
+            rows = 0
+
+            while not self.__cancel_requested.is_set():
+                records = cursor.fetchmany(chunk_size)
+                if not records:
+                    break
+
+                columns = [desc[0] for desc in cursor.description]
+                on_chunk(pd.DataFrame(records, columns=columns))
+                rows += len(records)
+
+            if self.__cancel_requested.is_set():
+                logging.info("Data stream cancelled")
+                self.__connection.rollback()
+                return self.__CANCELLED_MESSAGE
+
+            cursor.close()
+            if is_autocommit:
+                self.__connection.commit()
+            return rows
+        except psycopg2.ProgrammingError as e:
+            logging.error(f"Error: {os.linesep.join(arg for arg in e.args)}")
+            self.__connection.rollback()
+            return f'Error: {os.linesep.join(arg for arg in e.args)}'
+
+        except psycopg2.Error as e:
+            logging.error(f"Database error: {e.pgerror}")
+            self.__connection.rollback()
+            return f'Database error: {e.pgerror}'
+
+        except Exception as e:
+            logging.error(f"Error: {e}")
+            self.__connection.rollback()
+            return f'Error: {e}'
+
+    @classmethod
+    def __is_declarable(cls, query: str) -> bool:
+        words = query.lstrip(' \t\r\n(').split(None, 1)
+        return bool(words) and words[0].lower() in cls.__DECLARABLE_KEYWORDS
+
+    def __fetch_as_single_chunk(self, query: str, on_chunk, is_autocommit: bool, offset: int, limit: int):
+        """
+                Fetches a query through fetch_data() and hands the whole result over as one chunk.
+
+                Returns:
+                    int: The number of fetched rows.
+                    str: An error message if an error occurs.
+        """
+        result = self.fetch_data(query, is_autocommit=is_autocommit, offset=offset, limit=limit,
+                                 all_data=offset is None and limit is None)
+
+        if isinstance(result, str):
+            return result
+        if isinstance(result, tuple):
+            result = result[1]
+        if result is None or result.empty:
+            return 0
+
+        try:
+            on_chunk(result)
+        except Exception as e:
+            logging.error(f"Error: {e}")
+            return f'Error: {e}'
+
+        return len(result)
+
+    def explain_analyze(self, query: str):
+        """
+                Profiles a query with EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON).
+
+                EXPLAIN ANALYZE really executes the statement, so its effects are always rolled back. If the session
+                has an uncommitted transaction, only the profiled statement is rolled back through a savepoint.
+                Input holding more than one statement is rejected, since the statements after the first would run
+                outside of EXPLAIN.
+
+                Args:
+                    query (str): The SQL query to profile.
+
+                Returns:
+                    list: The decoded JSON plan.
+                    str: An error message if an error occurs.
+        """
+        if self.__cancel_requested.is_set():
+            return self.__CANCELLED_MESSAGE
+
+        statements = split_statements(query)
+        if len(statements) != 1:
+            logging.error(f"Profiling rejected: expected a single statement, got {len(statements)}")
+            return 'Error: Only a single SQL statement can be profiled.'
+        query = statements[0]
+
+        had_transaction = self.is_in_transaction()
+
+        try:
+            if had_transaction:
+                self.__cursor.execute(f"SAVEPOINT {self.__PROFILE_SAVEPOINT}")
+
+            if self.__cancel_requested.is_set():
+                self.__rollback_profiled_query(had_transaction)
+                return self.__CANCELLED_MESSAGE
+
+            self.__cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}")
+            plan = self.__cursor.fetchone()[0]
+            self.__rollback_profiled_query(had_transaction)
+            return plan
+        except psycopg2.ProgrammingError as e:
+            logging.error(f"Error: {os.linesep.join(arg for arg in e.args)}")
+            self.__rollback_profiled_query(had_transaction)
+            return f'Error: {os.linesep.join(arg for arg in e.args)}'
+
+        except psycopg2.Error as e:
+            logging.error(f"Database error: {e.pgerror}")
+            self.__rollback_profiled_query(had_transaction)
+            return f'Database error: {e.pgerror}'
+
+        except Exception as e:
+            logging.error(f"Error: {e}")
+            self.__rollback_profiled_query(had_transaction)
+            return f'Error: {e}'
+
+    def __rollback_profiled_query(self, had_transaction: bool):
+        """
+                Undoes the effects of a profiled query while keeping an already open transaction intact if possible.
+
+                Args:
+                    had_transaction (bool): Whether a transaction was open before profiling started.
+        """
+        if had_transaction:
+            try:
+                self.__cursor.execute(f"ROLLBACK TO SAVEPOINT {self.__PROFILE_SAVEPOINT}")
+                self.__cursor.execute(f"RELEASE SAVEPOINT {self.__PROFILE_SAVEPOINT}")
+                return
+            except psycopg2.Error as e:
+                logging.error(f"Unable to roll back to the profiling savepoint: {e.pgerror}")
+
+        self.__connection.rollback()
+
+    def is_in_transaction(self) -> bool:
+        """
+                Checks whether the session has an uncommitted transaction.
+
+                Returns:
+                    bool: True if a transaction is open on the connection.
+        """
+        return self.__connection.status == psycopg2.extensions.STATUS_BEGIN
+
+    def commit(self):
+        """
+                Commits the current transaction.
+        """
+        self.__connection.commit()
+
+    def rollback(self):
+        """
+                Rolls back the current transaction.
+        """
+        self.__connection.rollback()
+
+    def cancel(self):
+        """
+                Cancels the statement currently running on the connection and every statement issued after it.
+
+                Used when the session is abandoned. Safe to call from another thread while a query is in progress;
+                the interrupted call returns its usual error message and later calls return without reaching the
+                server, so a cancel arriving between two statements of one task is not lost.
+        """
+        self.__cancel_requested.set()
         if self.__connection:
+            self.__connection.cancel()
+
+    def __return_to_pool(self):
+        """
+                Resets the session and returns the connection to its pool.
+
+                Rolls back any open transaction and runs DISCARD ALL, so settings, temporary tables and prepared
+                statements of this session do not leak into the next one. If the reset fails, the connection is closed
+                instead of being reused.
+        """
+        try:
+            self.__cursor.close()
+            self.__connection.rollback()
+            self.__connection.autocommit = True
+            with self.__connection.cursor() as cursor:
+                cursor.execute("DISCARD ALL")
+            self.__connection.autocommit = False
+        except psycopg2.Error as e:
+            logging.error(f"Unable to reset the session, closing the connection: {e}")
+            self.__put_back(close=True)
+            return
+
+        self.__put_back(close=False)
+        logging.info("Database connection returned to the pool")
+
+    def __put_back(self, close: bool):
+        try:
+            self.__connection_pool.putconn(self.__connection, close=close)
+        except psycopg2.pool.PoolError as e:
+            logging.error(f"Unable to return the connection to the pool: {e}")
+            self.__connection.close()
+
+    def close(self):
+        """
+                Closes the connection, or returns it to its pool if it was checked out from one.
+        """
+        if not self.__connection:
+            return
+
+        if self.__connection_pool is not None:
+            self.__return_to_pool()
+        else:
             self.__connection.close()
             logging.info("Database connection closed")
+
+        self.__connection = None
+
+
+class PsqlConnectionPool:
+    """
+        A thread-safe pool of PostgreSQL connections shared by concurrently running query sessions.
+
+        Attributes:
+            __pool: A psycopg2 ThreadedConnectionPool holding the physical connections.
+    """
+
+    def __init__(self, db_params, max_connections: int = 5):
+        """
+                Opens the connection pool using provided parameters.
+
+                Args:
+                    db_params (dict): Database connection parameters including host, port, user, password, and dbname.
+                    max_connections (int): The maximum number of connections the pool may open at once.
+
+                Raises:
+                    Exception: If the connection to the database fails.
+        """
+        try:
+            self.__pool = psycopg2.pool.ThreadedConnectionPool(
+                1,
+                max_connections,
+                host=db_params['host'],
+                port=db_params['port'],
+                user=db_params['user'],
+                password=db_params['password'],
+                dbname=db_params['db']
+            )
+            logging.info(f"Successfully opened a connection pool (max connections: {max_connections})")
+        except Exception as e:
+            logging.error(f"Unable to connect to the database: {e}")
+            raise
+
+    def acquire(self) -> PsqlConnection:
+        """
+                Checks a connection out of the pool.
+
+                Returns:
+                    PsqlConnection: A session bound to the pooled connection. Call close() on it to give it back.
+
+                Raises:
+                    psycopg2.pool.PoolError: If all connections of the pool are in use.
+        """
+        try:
+            return PsqlConnection(connection_pool=self.__pool)
+        except psycopg2.pool.PoolError as e:
+            logging.error(f"Unable to acquire a connection from the pool: {e}")
+            raise
+
+    def close(self):
+        """
+                Closes all connections of the pool.
+        """
+        self.__pool.closeall()
+        logging.info("Connection pool closed")
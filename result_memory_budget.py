@@ -0,0 +1,79 @@
+import threading
+
+from pandas import DataFrame
+
+
+class ResultMemoryBudget:
+    """
+        Accounts the memory held by query results across all sessions so the application stays under one global limit.
+
+        Attributes:
+            __limit_bytes: The global limit in bytes, 0 for unlimited.
+            __usage: Bytes reserved per owner.
+            __lock: Guards __usage against concurrent reservations from worker threads.
+    """
+
+    def __init__(self, limit_bytes: int = 0):
+        """
+                Initializes an empty budget.
+
+                Args:
+                    limit_bytes (int): The global limit in bytes (0 for unlimited).
+        """
+        self.__limit_bytes = limit_bytes
+        self.__usage = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def limit_bytes(self) -> int:
+        return self.__limit_bytes
+
+    @property
+    def used_bytes(self) -> int:
+        with self.__lock:
+            return sum(self.__usage.values())
+
+    @staticmethod
+    def measure(data: DataFrame) -> int:
+        """
+                Estimates the memory footprint of a DataFrame, including the contents of object columns.
+
+                Args:
+                    data (DataFrame): The DataFrame to measure.
+
+                Returns:
+                    int: The size in bytes.
+        """
+        return int(data.memory_usage(index=True, deep=True).sum())
+
+    def reserve(self, owner, size: int) -> bool:
+        """
+                Reserves memory for an owner if it still fits into the global limit.
+
+                Args:
+                    owner: The object the memory is accounted to, e.g. a query tab.
+                    size (int): The number of bytes to reserve.
+
+                Returns:
+                    bool: True if the memory was reserved, False if it would exceed the limit.
+        """
+        with self.__lock:
+            if self.__limit_bytes and sum(self.__usage.values()) + size > self.__limit_bytes:
+                return False
+
+            self.__usage[owner] = self.__usage.get(owner, 0) + size
+            return True
+
+    def release(self, owner, size: int = None):
+        """
+                Releases memory previously reserved by an owner.
+
+                Args:
+                    owner: The object the memory is accounted to.
+                    size (int, optional): The number of bytes to release. Releases everything held by the owner if None.
+        """
+        with self.__lock:
+            if size is None or size >= self.__usage.get(owner, 0):
+                self.__usage.pop(owner, None)
+            else:
+                self.__usage[owner] -= size
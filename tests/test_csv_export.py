@@ -0,0 +1,53 @@
+import pandas as pd
+
+from csv_export import CsvPartWriter
+
+
+def _chunk(start, stop):
+    return pd.DataFrame({"id": range(start, stop), "name": [f"row {i}" for i in range(start, stop)]})
+
+
+def test_single_file_without_limits(tmp_path):
+    file_path = str(tmp_path / "out.csv")
+    with CsvPartWriter(file_path) as writer:
+        writer.write(_chunk(0, 3))
+        writer.write(_chunk(3, 5))
+
+    assert writer.part_count == 1
+    assert writer.rows_written == 5
+    assert pd.read_csv(file_path)["id"].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_row_limit_splits_across_chunks(tmp_path):
+    file_path = str(tmp_path / "out.csv")
+    with CsvPartWriter(file_path, max_file_rows=4) as writer:
+        writer.write(_chunk(0, 3))
+        writer.write(_chunk(3, 10))
+
+    assert writer.part_count == 3
+    assert pd.read_csv(file_path)["id"].tolist() == [0, 1, 2, 3]
+    assert pd.read_csv(tmp_path / "out_part2.csv")["id"].tolist() == [4, 5, 6, 7]
+    assert pd.read_csv(tmp_path / "out_part3.csv")["id"].tolist() == [8, 9]
+
+
+def test_size_limit_keeps_parts_under_limit_with_headers(tmp_path):
+    file_path = str(tmp_path / "out.csv")
+    max_file_size = 64 / (1024 * 1024)
+    with CsvPartWriter(file_path, max_file_size=max_file_size) as writer:
+        writer.write(_chunk(0, 20))
+
+    parts = [tmp_path / "out.csv"] + [tmp_path / f"out_part{n}.csv" for n in range(2, writer.part_count + 1)]
+    assert writer.part_count > 1
+    assert all(part.stat().st_size <= 64 for part in parts)
+    assert pd.concat(pd.read_csv(part) for part in parts)["id"].tolist() == list(range(20))
+
+
+def test_size_limit_keeps_multiline_fields_in_one_record(tmp_path):
+    file_path = str(tmp_path / "out.csv")
+    data = pd.DataFrame({"id": [1, 2, 3], "note": ["a\nb", 'say "hi"\nthere', "c"]})
+    with CsvPartWriter(file_path, max_file_size=30 / (1024 * 1024)) as writer:
+        writer.write(data)
+
+    parts = [tmp_path / "out.csv"] + [tmp_path / f"out_part{n}.csv" for n in range(2, writer.part_count + 1)]
+    result = pd.concat([pd.read_csv(part) for part in parts], ignore_index=True)
+    assert result.equals(data)
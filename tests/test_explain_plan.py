@@ -0,0 +1,147 @@
+import json
+
+import pytest
+
+from explain_plan import ExplainPlan, PlanHistory
+
+
+def _node(node_type, total_time, loops=1, rows=1, plan_rows=1, hit=0, read=0, children=(), **extra):
+    node = {'Node Type': node_type, 'Actual Total Time': total_time, 'Actual Loops': loops, 'Actual Rows': rows,
+            'Plan Rows': plan_rows, 'Shared Hit Blocks': hit, 'Shared Read Blocks': read, **extra}
+    if children:
+        node['Plans'] = list(children)
+    return node
+
+
+def _explain(root, execution_time=0.0, planning_time=0.0):
+    return [{'Plan': root, 'Planning Time': planning_time, 'Execution Time': execution_time}]
+
+
+def test_self_time_and_self_buffers_subtract_children():
+    plan = ExplainPlan(_explain(
+        _node('Hash Join', 10.0, hit=30, read=5, children=[
+            _node('Seq Scan', 6.0, hit=20, read=5, **{'Relation Name': 'orders', 'Alias': 'o'}),
+            _node('Hash', 1.0, hit=4, children=[_node('Seq Scan', 0.8, hit=4, **{'Relation Name': 'users'})]),
+        ])
+    ))
+    join, scan, hash_node, inner_scan = plan.root.walk()
+
+    assert join.self_time == pytest.approx(3.0)
+    assert scan.self_time == pytest.approx(6.0)
+    assert hash_node.self_time == pytest.approx(0.2)
+    assert (join.shared_hit_blocks, join.shared_read_blocks) == (6, 0)
+    assert (scan.shared_hit_blocks, scan.shared_read_blocks) == (20, 5)
+    assert (hash_node.total_shared_hit_blocks, hash_node.shared_hit_blocks) == (4, 0)
+    assert scan.description == "Seq Scan on orders o"
+    assert inner_scan.description == "Seq Scan on users"
+
+
+def test_loops_multiply_time_and_rows_outside_parallel_plans():
+    plan = ExplainPlan(_explain(
+        _node('Nested Loop', 12.0, rows=100, children=[
+            _node('Seq Scan', 2.0, rows=10),
+            _node('Index Scan', 0.5, loops=10, rows=10, plan_rows=1, **{'Index Name': 'ix', 'Relation Name': 't'}),
+        ])
+    ))
+    _, _, index_scan = plan.root.walk()
+
+    assert index_scan.total_time == pytest.approx(5.0)
+    assert index_scan.actual_rows == 100
+    assert index_scan.plan_rows == 10
+    assert index_scan.misestimate == pytest.approx(10.0)
+    assert plan.root.self_time == pytest.approx(5.0)
+
+
+def test_parallel_nodes_are_not_summed_over_concurrent_workers():
+    plan = ExplainPlan(_explain(
+        _node('Gather', 100.0, rows=300, plan_rows=300, **{'Workers Planned': 2, 'Workers Launched': 2}, children=[
+            _node('Seq Scan', 95.0, loops=3, rows=100, plan_rows=100, **{'Parallel Aware': True}),
+        ]),
+        execution_time=100.5
+    ))
+    gather, scan = plan.root.walk()
+
+    assert scan.total_time == pytest.approx(95.0)
+    assert gather.self_time == pytest.approx(5.0)
+    assert scan.actual_rows == 300
+    assert plan.self_time_share(scan) == pytest.approx(0.95)
+    assert plan.hot_spots() == [scan]
+
+
+def test_parallel_plan_with_fewer_workers_launched_than_planned():
+    plan = ExplainPlan(_explain(
+        _node('Gather Merge', 50.0, **{'Workers Planned': 4, 'Workers Launched': 1}, children=[
+            _node('Sort', 45.0, loops=2, children=[_node('Seq Scan', 30.0, loops=2)]),
+        ])
+    ))
+    gather, sort, scan = plan.root.walk()
+
+    assert sort.total_time == pytest.approx(45.0)
+    assert sort.self_time == pytest.approx(15.0)
+    assert gather.self_time == pytest.approx(5.0)
+
+
+def test_node_that_never_ran():
+    plan = ExplainPlan(_explain(
+        _node('Append', 1.0, children=[
+            _node('Seq Scan', 1.0),
+            _node('Seq Scan', 0.0, loops=0, rows=0, plan_rows=500),
+        ])
+    ))
+    _, _, skipped = plan.root.walk()
+
+    assert not skipped.was_executed
+    assert skipped.total_time == 0.0
+    assert skipped.self_time == 0.0
+    assert skipped.misestimate == 1.0
+    assert plan.self_time_share(skipped) == 0.0
+
+
+def test_negative_self_time_is_not_hidden():
+    plan = ExplainPlan(_explain(_node('Limit', 1.0, children=[_node('Seq Scan', 1.2)])))
+
+    assert plan.root.self_time == pytest.approx(-0.2)
+
+
+def test_misestimate_is_symmetric():
+    plan = ExplainPlan(_explain(_node('Result', 0.0, children=[
+        _node('Seq Scan', 0.0, rows=5, plan_rows=500),
+        _node('Seq Scan', 0.0, rows=500, plan_rows=5),
+        _node('Seq Scan', 0.0, rows=0, plan_rows=0),
+    ])))
+    _, underestimated, overestimated, empty = plan.root.walk()
+
+    assert underestimated.misestimate == pytest.approx(100.0)
+    assert overestimated.misestimate == pytest.approx(100.0)
+    assert empty.misestimate == 1.0
+
+
+def test_hot_spot_threshold_and_order():
+    plan = ExplainPlan(_explain(_node('Append', 100.0, children=[
+        _node('Seq Scan', 9.0),
+        _node('Seq Scan', 10.0),
+        _node('Seq Scan', 81.0),
+    ])))
+    _, cold, threshold, hottest = plan.root.walk()
+
+    assert plan.hot_spots() == [hottest, threshold]
+
+
+def test_parses_json_text_and_timings():
+    plan = ExplainPlan(json.dumps(_explain(_node('Result', 0.1), execution_time=0.2, planning_time=0.05)))
+
+    assert plan.execution_time == 0.2
+    assert plan.planning_time == 0.05
+    assert plan.root.description == "Result"
+
+
+def test_history_keeps_latest_runs_per_normalized_query():
+    history = PlanHistory(max_runs=2)
+    plans = [ExplainPlan(_explain(_node('Result', float(i)))) for i in range(3)]
+    for plan in plans:
+        history.add("SELECT  1\n", plan)
+    history.add("SELECT 2", plans[0])
+
+    assert history.runs("select 1") == []
+    assert history.runs(" SELECT 1") == plans[1:]
+    assert history.runs("SELECT 2") == plans[:1]
@@ -0,0 +1,173 @@
+import psycopg2
+import psycopg2.extensions
+import pytest
+
+from psql_connection import PsqlConnection, split_statements
+
+
+class _FakeCursor:
+    def __init__(self, connection, name=None):
+        self.__connection = connection
+        self.name = name
+        self.description = None
+        self.__rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def execute(self, query):
+        self.__connection.executed.append((query, self.__connection.autocommit, self.name))
+        if self.__connection.failing_statement and query.startswith(self.__connection.failing_statement):
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        self.description, self.__rows = self.__connection.results.get(query, (None, []))
+
+    def fetchall(self):
+        return self.__rows
+
+    def fetchone(self):
+        return self.__rows[0]
+
+    def fetchmany(self, size):
+        rows, self.__rows = self.__rows[:size], self.__rows[size:]
+        return rows
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.status = psycopg2.extensions.STATUS_READY
+        self.autocommit = False
+        self.executed = []
+        self.results = {}
+        self.failing_statement = None
+        self.rollbacks = 0
+
+    def cursor(self, name=None):
+        return _FakeCursor(self, name)
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def commit(self):
+        pass
+
+    def cancel(self):
+        pass
+
+
+class _FakePool:
+    def __init__(self, connection):
+        self.connection = connection
+        self.returned = []
+
+    def getconn(self):
+        return self.connection
+
+    def putconn(self, connection, close=False):
+        self.returned.append((connection, close))
+
+
+def _pooled_connection():
+    pool = _FakePool(_FakeConnection())
+    return PsqlConnection(connection_pool=pool), pool
+
+
+def test_close_resets_the_session_before_returning_it_to_the_pool():
+    psql_connection, pool = _pooled_connection()
+    connection = pool.connection
+
+    psql_connection.close()
+
+    assert connection.rollbacks == 1
+    assert connection.executed == [("DISCARD ALL", True, None)]
+    assert connection.autocommit is False
+    assert pool.returned == [(connection, False)]
+
+
+def test_close_discards_the_connection_if_the_reset_fails():
+    psql_connection, pool = _pooled_connection()
+    pool.connection.failing_statement = "DISCARD"
+
+    psql_connection.close()
+
+    assert pool.returned == [(pool.connection, True)]
+
+
+def test_statements_issued_after_cancel_do_not_reach_the_server():
+    psql_connection, pool = _pooled_connection()
+
+    psql_connection.cancel()
+
+    assert psql_connection.fetch_data("SELECT 1", count_only=True) == 'Error: The operation was cancelled.'
+    assert psql_connection.fetch_data("SELECT 1", limit=100, offset=0) == 'Error: The operation was cancelled.'
+    assert psql_connection.explain_analyze("SELECT 1") == 'Error: The operation was cancelled.'
+    assert psql_connection.stream_data("SELECT 1", lambda chunk: None) == 'Error: The operation was cancelled.'
+    assert pool.connection.executed == []
+
+
+def test_stream_data_fetches_show_queries_without_declaring_a_cursor():
+    psql_connection, pool = _pooled_connection()
+    pool.connection.results["SHOW search_path"] = ([("search_path",)], [('"$user", public',)])
+    chunks = []
+
+    rows = psql_connection.stream_data("SHOW search_path", chunks.append)
+
+    assert rows == 1
+    assert [chunk.to_dict("records") for chunk in chunks] == [[{"search_path": '"$user", public'}]]
+    assert pool.connection.executed == [("SHOW search_path", True, None)]
+
+
+def test_stream_data_declares_a_cursor_for_select_queries():
+    psql_connection, pool = _pooled_connection()
+    pool.connection.results["SELECT id FROM t"] = ([("id",)], [(1,), (2,), (3,)])
+    chunks = []
+
+    rows = psql_connection.stream_data("SELECT id FROM t", chunks.append, chunk_size=2)
+
+    assert rows == 3
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert pool.connection.executed == [("SELECT id FROM t", False, "psqlvue_stream")]
+
+
+@pytest.mark.parametrize("query, statements", [
+    ("SELECT 1", ["SELECT 1"]),
+    ("SELECT 1;", ["SELECT 1"]),
+    ("  SELECT 1 ;  -- done\n", ["SELECT 1"]),
+    ("SELECT 1; COMMIT; DELETE FROM t", ["SELECT 1", "COMMIT", "DELETE FROM t"]),
+    ("SELECT ';' AS semicolon", ["SELECT ';' AS semicolon"]),
+    ("SELECT 'it''s; fine'", ["SELECT 'it''s; fine'"]),
+    ("SELECT E'it\\'s; fine'", ["SELECT E'it\\'s; fine'"]),
+    ('SELECT 1 AS "a;""b"', ['SELECT 1 AS "a;""b"']),
+    ("SELECT 1 -- ; not a statement\n", ["SELECT 1 -- ; not a statement"]),
+    ("SELECT /* ; /* nested ; */ still comment ; */ 1", ["SELECT /* ; /* nested ; */ still comment ; */ 1"]),
+    ("SELECT $fn$ a; b $fn$, $$;$$", ["SELECT $fn$ a; b $fn$, $$;$$"]),
+    (";; -- nothing\n", []),
+])
+def test_split_statements(query, statements):
+    assert split_statements(query) == statements
+
+
+def test_explain_analyze_rejects_multiple_statements_before_reaching_the_server():
+    psql_connection, pool = _pooled_connection()
+
+    result = psql_connection.explain_analyze("SELECT 1; COMMIT; DELETE FROM t")
+
+    assert result == 'Error: Only a single SQL statement can be profiled.'
+    assert pool.connection.executed == []
+
+
+def test_explain_analyze_strips_the_trailing_semicolon_and_rolls_back():
+    psql_connection, pool = _pooled_connection()
+    explain = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) DELETE FROM t"
+    pool.connection.results[explain] = ([("QUERY PLAN",)], [([{"Plan": {"Node Type": "Delete"}}],)])
+
+    plan = psql_connection.explain_analyze("DELETE FROM t;")
+
+    assert plan == [{"Plan": {"Node Type": "Delete"}}]
+    assert pool.connection.executed == [(explain, False, None)]
+    assert pool.connection.rollbacks == 1
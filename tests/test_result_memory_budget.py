@@ -0,0 +1,110 @@
+import argparse
+import threading
+
+import pandas as pd
+import pytest
+
+from main import non_negative_int, positive_int
+from result_memory_budget import ResultMemoryBudget
+
+
+def test_reserve_within_limit_and_reject_above_it():
+    budget = ResultMemoryBudget(limit_bytes=100)
+
+    assert budget.reserve("tab 1", 60)
+    assert budget.reserve("tab 1", 40)
+    assert not budget.reserve("tab 1", 1)
+    assert budget.used_bytes == 100
+
+
+def test_rejected_reservation_does_not_change_usage():
+    budget = ResultMemoryBudget(limit_bytes=100)
+    budget.reserve("tab 1", 70)
+
+    assert not budget.reserve("tab 2", 31)
+    assert budget.used_bytes == 70
+    assert budget.reserve("tab 2", 30)
+
+
+def test_limit_is_shared_by_all_owners():
+    budget = ResultMemoryBudget(limit_bytes=100)
+
+    assert budget.reserve("tab 1", 50)
+    assert budget.reserve("tab 2", 50)
+    assert not budget.reserve("tab 3", 1)
+
+    budget.release("tab 1")
+    assert budget.used_bytes == 50
+    assert budget.reserve("tab 3", 50)
+
+
+def test_partial_release_keeps_the_rest_of_the_owner():
+    budget = ResultMemoryBudget(limit_bytes=100)
+    budget.reserve("tab 1", 80)
+
+    budget.release("tab 1", 30)
+    assert budget.used_bytes == 50
+
+    budget.release("tab 1", 500)
+    assert budget.used_bytes == 0
+    assert budget.reserve("tab 1", 100)
+
+
+def test_release_of_unknown_owner_is_a_no_op():
+    budget = ResultMemoryBudget(limit_bytes=100)
+    budget.reserve("tab 1", 10)
+
+    budget.release("tab 2")
+    budget.release("tab 2", 5)
+
+    assert budget.used_bytes == 10
+
+
+def test_zero_limit_is_unlimited():
+    budget = ResultMemoryBudget(limit_bytes=0)
+
+    assert budget.reserve("tab 1", 10 ** 12)
+    assert budget.reserve("tab 2", 10 ** 12)
+    assert budget.used_bytes == 2 * 10 ** 12
+
+
+def test_concurrent_reservations_never_exceed_the_limit():
+    budget = ResultMemoryBudget(limit_bytes=1000)
+    granted = []
+
+    def reserve(owner):
+        for _ in range(100):
+            if budget.reserve(owner, 7):
+                granted.append(7)
+
+    threads = [threading.Thread(target=reserve, args=(f"tab {n}",)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert budget.used_bytes == sum(granted) <= 1000
+    assert budget.used_bytes > 1000 - 7
+
+
+def test_measure_counts_object_column_contents():
+    short = pd.DataFrame({"text": ["a"] * 100})
+    long = pd.DataFrame({"text": ["a" * 1000] * 100})
+
+    assert ResultMemoryBudget.measure(long) - ResultMemoryBudget.measure(short) >= 100 * 999
+
+
+def test_positive_int():
+    assert positive_int("5") == 5
+    for value in ("0", "-1"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            positive_int(value)
+    with pytest.raises(ValueError):
+        positive_int("five")
+
+
+def test_non_negative_int():
+    assert non_negative_int("0") == 0
+    assert non_negative_int("1024") == 1024
+    with pytest.raises(argparse.ArgumentTypeError):
+        non_negative_int("-1")